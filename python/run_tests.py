@@ -4,6 +4,7 @@
 import sys
 import os
 import subprocess
+import importlib.util
 from pathlib import Path
 
 
@@ -14,45 +15,40 @@ def run_tests():
     src_path = Path(__file__).parent / "src"
     sys.path.insert(0, str(src_path))
 
-    # Test commands to run (override coverage options from pyproject.toml)
-    test_commands = [
-        # Quick tests (fast)
-        [
-            "python", "-m", "pytest",
-            "tests/test_key_value_pair.py",
-            "tests/test_btree_node.py",
-            "tests/test_btree_index.py",
-            "-v", "--tb=short", "--override-ini=addopts="
-        ],
-
-        # Performance tests (marked as slow)
-        [
-            "python", "-m", "pytest",
-            "tests/test_btree_performance.py",
-            "-v", "-m", "not slow", "--tb=short", "--override-ini=addopts="
-        ],
+    # Single pytest invocation (override coverage options from pyproject.toml)
+    # so collection/startup cost is paid once instead of per test group
+    cmd = [
+        "python", "-m", "pytest",
+        "tests/test_key_value_pair.py",
+        "tests/test_btree_node.py",
+        "tests/test_btree_index.py",
+        "tests/test_btree_performance.py",
+        "-v", "-m", "not slow", "--tb=short", "--override-ini=addopts="
     ]
 
+    # Parallelize across cores when pytest-xdist is available; --dist=loadfile
+    # keeps each module's tests on one worker so the timing-sensitive
+    # performance tests are not interleaved with other load
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", "auto", "--dist=loadfile"]
+
     print("🌲 Running B-Tree Comprehensive Test Suite")
     print("=" * 50)
+    print(f"Command: {' '.join(cmd)}")
+    print("-" * 30)
 
     all_passed = True
 
-    for i, cmd in enumerate(test_commands, 1):
-        print(f"\n📋 Running test group {i}/{len(test_commands)}")
-        print(f"Command: {' '.join(cmd)}")
-        print("-" * 30)
-
-        try:
-            result = subprocess.run(cmd, check=True, cwd=Path(__file__).parent)
-            print(f"✅ Test group {i} PASSED")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Test group {i} FAILED with exit code {e.returncode}")
-            all_passed = False
-        except FileNotFoundError:
-            print(f"❌ Test group {i} FAILED - pytest not found")
-            print("Please install pytest: pip install pytest")
-            all_passed = False
+    try:
+        subprocess.run(cmd, check=True, cwd=Path(__file__).parent)
+        print("✅ Test suite PASSED")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Test suite FAILED with exit code {e.returncode}")
+        all_passed = False
+    except FileNotFoundError:
+        print("❌ Test suite FAILED - pytest not found")
+        print("Please install pytest: pip install pytest")
+        all_passed = False
 
     print("\n" + "=" * 50)
     if all_passed:
@@ -1,9 +1,11 @@
 from typing import Generic, TypeVar, Optional
-from .btree_node import BTreeNode
+from bisect import bisect_left
+from .btree_node import BTreeNode, _FrozenSlot
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+
 class BTreeIndex(Generic[K, V]):
     """
     Production-grade B-Tree index implementation with memory optimization.
@@ -12,76 +14,162 @@ class BTreeIndex(Generic[K, V]):
     rebalancing. Uses memory-efficient design suitable for millions of entries.
 
     Args:
-        min_degree: Minimum degree (t) of the B-Tree, must be >= 2
+        min_degree: Minimum degree (t) of the B-Tree, must be >= 2.
+            Defaults to 32: wide nodes mean fewer levels per operation and
+            ~t times fewer node allocations during splits, and bisect makes
+            in-node search cost grow only logarithmically with the fanout.
+            Small degrees (2-6) remain useful in tests and examples where
+            splits and merges should actually happen.
     """
-    __slots__ = ("_min_degree", "_root", "_size")
+    # Maximum number of recycled nodes kept alive; splits and merges roughly
+    # balance out over time so a small pool absorbs the churn while keeping
+    # the retained-object footprint negligible
+    _FREE_NODE_LIMIT = 16
+
+    __slots__ = ("_min_degree", "_min_keys", "_max_keys", "_root", "_size",
+                 "_free_nodes")
 
-    def __init__(self, min_degree: int):
+    def __init__(self, min_degree: int = 32):
         if min_degree < 2:
             raise ValueError("Minimum degree must be at least 2")
-        # Make _min_degree immutable
-        super().__setattr__("_min_degree", min_degree)
-        self._root = BTreeNode(self._min_degree, True)
+        # _min_degree is frozen by the _FrozenSlot installed below the class
+        # body; write through the retained member descriptor to initialize it
+        _MIN_DEGREE_MEMBER.__set__(self, min_degree)
+        # Derived capacity bounds, computed once so hot loops skip the
+        # attribute load + arithmetic per comparison
+        self._min_keys = min_degree - 1
+        self._max_keys = 2 * min_degree - 1
+        self._root = BTreeNode(min_degree, True)
         self._size = 0
+        # Pool of nodes emptied by merges, reused by later splits to avoid
+        # re-allocating a node object plus three fresh lists each time
+        self._free_nodes = []
+
+    def __class_getitem__(cls, item):
+        # The generic parameters serve static checkers only; skip typing's
+        # _GenericAlias construction (and its per-use allocation) so
+        # BTreeIndex[int, str] is just the class itself at runtime
+        return cls
 
 
     def search(self, key: K) -> Optional[V]:
         if self.is_empty():
             return None
         
-        # Traverse the tree to find the key
+        # Traverse the tree to find the key. This is the hottest loop in the
+        # module, so hoist the bisect global into a local and read node slots
+        # (keys/values/children/_is_leaf) directly - each LOAD_ATTR or
+        # LOAD_GLOBAL skipped saves real time per level on CPython.
+        bl = bisect_left
         current = self._root
         while True:
-            index = current.find_key_index(key)
+            keys = current.keys
+            index = bl(keys, key)
 
-            if index >= 0: # If key is found in the node
-                return current.get_value(index)
-            else:
-                # If the current node is leaf, it means the key is not present in the tree
-                if current.is_leaf:
-                    return None
-                else:
-                    current = current.get_child(current.get_child_index(key))
+            if index < len(keys) and keys[index] == key: # If key is found in the node
+                return current.values[index]
+            # If the current node is leaf, it means the key is not present in the tree
+            if current._is_leaf:
+                return None
+            # bisect_left's insertion point doubles as the child index
+            current = current.children[index]
+
+    def search_many(self, keys) -> 'list[Optional[V]]':
+        """Look up many keys in one shared traversal.
+
+        Returns the values in input order (None for missing keys). The
+        probes are sorted once, then the tree is walked top-down with each
+        node visited at most once per contiguous probe run: at every node
+        the probe slice is partitioned against the node's keys, hits are
+        emitted, and each child receives only the sub-slice it can contain.
+        For m probes over n entries that is O(m log m + n) node work
+        instead of m independent O(log n) descents.
+        """
+        probes = [(key, position) for position, key in enumerate(keys)]
+        probes.sort()
+        results: 'list[Optional[V]]' = [None] * len(probes)
+        if not probes or self.is_empty():
+            return results
+
+        bl = bisect_left
+        stack = [(self._root, 0, len(probes))]
+        while stack:
+            node, lo, hi = stack.pop()
+            node_keys = node.keys
+            is_leaf = node._is_leaf
+            start = lo
+            for j, node_key in enumerate(node_keys):
+                # Probes strictly below this key belong to child j. The
+                # 1-tuple sentinel sorts before every (node_key, position)
+                # probe, so bisect lands on the first probe >= node_key.
+                split = bl(probes, (node_key,), start, hi)
+                if not is_leaf and split > start:
+                    stack.append((node.children[j], start, split))
+                start = split
+                while start < hi and probes[start][0] == node_key:
+                    results[probes[start][1]] = node.values[j]
+                    start += 1
+                if start == hi:
+                    break
+            if not is_leaf and start < hi:
+                stack.append((node.children[len(node_keys)], start, hi))
+        return results
 
     def insert(self, key: K, value: V) -> Optional[V]:
+        if key is None:
+            raise ValueError("Key cannot be null")
+
         # 1. Handle empty tree
         if self.is_empty():
             self._root.insert_key_value(key, value)
             self._size += 1
             return None
         
-        # 2. Split root if it's full (proactive splitting)
-        if self._root.is_full():
-            new_root = BTreeNode(self._min_degree, False)
+        # 2. Split root if it's full (proactive splitting). Compare the key
+        # count against the precomputed _max_keys directly - no method call,
+        # no re-derived arithmetic - since this runs on every insert.
+        if len(self._root.keys) == self._max_keys:
+            new_root = self._allocate_node(False)
             new_root.insert_child(0, self._root)
-            self._split_node(self._root, new_root)
+            self._split_node(self._root, new_root, 0)
             self._root = new_root
 
-        # 3. Simple traversal with proactive splitting
+        # 3. Simple traversal with proactive splitting. As in search, hoist
+        # the bisect global and the capacity bound into locals and read the
+        # _is_leaf slot directly - this loop runs once per level per insert.
+        bl = bisect_left
+        max_keys = self._max_keys
         current = self._root
         while True:
-            key_index = current.find_key_index(key)
+            keys = current.keys
+            key_index = bl(keys, key)
             # If key already exists in the tree, we will only update the value
-            if key_index >= 0:
-                old_value = current.get_value(key_index)
-                current.get_key_value_pair(key_index).value = value
+            if key_index < len(keys) and keys[key_index] == key:
+                old_value = current.values[key_index]
+                current.values[key_index] = value
                 return old_value
-            
+
             # If the key doesn't exist in the tree - descent or insert
-            if current.is_leaf:
+            if current._is_leaf:
                 # Leaf node - insert here (guaranteed to have space)
-                current.insert_key_value(key, value)
+                keys.insert(key_index, key)
+                current.values.insert(key_index, value)
                 self._size += 1
                 return None
             else:
-                # For internal node, find child or split
-                child_index = current.get_child_index(key)
-                child = current.get_child(child_index)
+                # For internal node, the insertion point doubles as the child index
+                child = current.children[key_index]
                 # Split child if full, before descending
-                if child.is_full():
-                    self._split_node(child, current)
-                    child_index = current.get_child_index(key)
-                    child = current.get_child(child_index)
+                if len(child.keys) == max_keys:
+                    self._split_node(child, current, key_index)
+                    # The median was promoted into this node at key_index -
+                    # compare against it directly instead of re-searching
+                    median = keys[key_index]
+                    if median == key:
+                        old_value = current.values[key_index]
+                        current.values[key_index] = value
+                        return old_value
+                    child = current.children[key_index if key < median else key_index + 1]
                 # Descend to child
                 current = child
             
@@ -91,262 +179,342 @@ class BTreeIndex(Generic[K, V]):
         if self.is_empty():
             return None
 
-        # 2. Handle root
-        result = self._delete_from_node(self._root, key)
-        # 3. If root is empty but has children, promote child to root
-        if len(self._root) == 0 and not self._root.is_leaf:
-            self._root = self._root.get_child(0)
-        
-        return result
+        # 2. Single top-down pass (CLRS B-Tree-Delete): before descending into
+        # a minimal child we proactively borrow/merge so every node we enter
+        # has at least min_degree keys. No recursion, no post-return underflow
+        # fixups.
+        min_keys = self._min_keys
+        # Value of the key originally asked for; set once the key is found in
+        # an internal node and we switch to deleting its predecessor/successor.
+        result = None
+        found_internal = False
 
+        current = self._root
+        while True:
+            keys = current.keys
+            index = bisect_left(keys, key)
+            found = index < len(keys) and keys[index] == key
 
-    
-    def _split_node(self, current: BTreeNode[K, V], parent: BTreeNode[K, V]) -> None:
-        # 1. Get the middle index
-        middle_index = self._min_degree - 1
-        # 2. Remove middle key from the original node
-        middle_kv_pair = current.remove_key_value_pair(middle_index)
-        # 3. Create new right node
-        right = BTreeNode(self._min_degree, current.is_leaf)
-        
-        # 4. Move keys from middle_index + 1 ... end to the right node
-        while len(current) > middle_index:
-            key_value_pair = current.remove_key_value_pair(middle_index)
-            right.insert_key_value(key_value_pair.key, key_value_pair.value)
-        
-        # 5. If not leaf (internal node), move all children from middle_index + 1 ... end
-        # to the right node
-        if not current.is_leaf:
-            while len(current.children) > middle_index + 1:
-                child = current.remove_child(middle_index + 1)
-                right.insert_child(len(right.children), child)
-
-        # 6. If it comes to root split, we create a new internal node and add current and right
-        # to its children
-        if parent is None:
-            split_root = BTreeNode(self._min_degree, False)
-            split_root.insert_key_value(middle_kv_pair.key, middle_kv_pair.value)
-            split_root.insert_child(0, current)
-            split_root.insert_child(1, right)
-            self._root = split_root
-            return
-        
-        # 7. If we are splitting internal node, we add right as one of its children
-        parent.insert_key_value(middle_kv_pair.key, middle_kv_pair.value)
-        insertion_index = parent.find_key_index(middle_kv_pair.key) + 1
-        parent.insert_child(insertion_index, right)
-
-    def _delete_from_node(self, current: BTreeNode[K, V], key: K) -> V:
-        key_index = current.find_key_index(key)
-        if key_index >= 0:
-            # Key found in the current node
-            if current.is_leaf:
-                # Simple leaf deletion
-                result = current.remove_key_value_pair(key_index).value
+            if current._is_leaf:
+                # 3. Leaf - either the key is here or it is not in the tree
+                if not found:
+                    return None
+                del keys[index]
+                value = current.values.pop(index)
                 self._size -= 1
-                return result
+                return result if found_internal else value
+
+            if found:
+                # 4. Key found in an internal node - replace it with its
+                # predecessor or successor and keep descending to delete that
+                # key from the corresponding child (which we first guarantee
+                # has >= min_degree keys).
+                if not found_internal:
+                    found_internal = True
+                    result = current.values[index]
+
+                left_child = current.children[index]
+                right_child = current.children[index + 1]
+                if len(left_child) > min_keys:
+                    # Replace with predecessor - rightmost key of left subtree
+                    node = left_child
+                    while not node._is_leaf:
+                        node = node.children[-1]
+                    key = node.keys[-1]
+                    keys[index] = key
+                    current.values[index] = node.values[-1]
+                    current = left_child
+                elif len(right_child) > min_keys:
+                    # Replace with successor - leftmost key of right subtree
+                    node = right_child
+                    while not node._is_leaf:
+                        node = node.children[0]
+                    key = node.keys[0]
+                    keys[index] = key
+                    current.values[index] = node.values[0]
+                    current = right_child
+                else:
+                    # Both children are minimal - merge them around the key
+                    # and continue the delete inside the merged node
+                    self._merge_children(current, index)
+                    if current is self._root and len(current) == 0:
+                        self._root = left_child
+                        self._release_node(current)
+                    current = left_child
+                continue
+
+            # 5. Key not here - make the target child non-minimal, then descend
+            child = current.children[index]
+            if len(child) == min_keys:
+                if index > 0 and len(current.children[index - 1]) > min_keys:
+                    self._borrow_from_left_sibling(child, current, index)
+                elif index < len(current.children) - 1 and len(current.children[index + 1]) > min_keys:
+                    self._borrow_from_right_sibling(child, current, index)
+                elif index > 0:
+                    # Merge child into its left sibling
+                    child = current.children[index - 1]
+                    self._merge_children(current, index - 1)
+                    if current is self._root and len(current) == 0:
+                        self._root = child
+                        self._release_node(current)
+                else:
+                    # Merge the right sibling into child
+                    self._merge_children(current, index)
+                    if current is self._root and len(current) == 0:
+                        self._root = child
+                        self._release_node(current)
+            current = child
+
+    def insert_many(self, items) -> None:
+        """Insert (key, value) pairs, amortizing descents for sorted runs.
+
+        Consecutive keys usually land in the same leaf when the input is
+        sorted or nearly sorted (index rebuilds, bulk appends). Instead of a
+        full root-to-leaf descent per key, the leaf from the previous insert
+        is cached together with the open key interval it covers (taken from
+        the separators along its path); keys inside that interval go straight
+        into the leaf while it has room. Falls back to a regular insert when
+        the key leaves the interval or the leaf fills up.
+        """
+        bl = bisect_left
+        leaf = None
+        lo = hi = None
+        max_keys = self._max_keys
+        for key, value in items:
+            if (leaf is not None
+                    and len(leaf.keys) < max_keys
+                    and (lo is None or lo < key)
+                    and (hi is None or key < hi)):
+                index = bl(leaf.keys, key)
+                if index < len(leaf.keys) and leaf.keys[index] == key:
+                    leaf.values[index] = value
+                else:
+                    leaf.keys.insert(index, key)
+                    leaf.values.insert(index, value)
+                    self._size += 1
+                continue
+            # Cache miss - regular insert, then remember the leaf the key
+            # landed in (and its covering interval) for the next item
+            self.insert(key, value)
+            leaf, lo, hi = self._locate_leaf(key)
+
+    def _locate_leaf(self, key: K):
+        """Return (leaf, lo, hi): the leaf owning key plus the open interval
+        (lo, hi) of keys routed to it, or (None, None, None) when the key
+        lives in an internal node."""
+        lo = hi = None
+        current = self._root
+        while not current._is_leaf:
+            keys = current.keys
+            index = bisect_left(keys, key)
+            if index < len(keys) and keys[index] == key:
+                return None, None, None
+            if index > 0:
+                lo = keys[index - 1]
+            if index < len(keys):
+                hi = keys[index]
+            current = current.children[index]
+        return current, lo, hi
+
+    @classmethod
+    def bulk_load(cls, items, min_degree: int = 32) -> 'BTreeIndex[K, V]':
+        """Build a densely packed B-Tree from (key, value) pairs in O(n).
+
+        Inserting n sorted items one by one costs n descents and ~n/t splits;
+        bulk loading sorts once, packs leaves to capacity, and builds parent
+        levels bottom-up with zero splits and ~100% fill factor (vs ~69% for
+        incremental inserts). Duplicate keys collapse to the last occurrence,
+        matching insert()'s update semantics.
+        """
+        index = cls(min_degree)
+        entries = sorted(items, key=lambda item: item[0])
+        # Collapse duplicate keys - the last occurrence wins
+        if entries:
+            deduped = [entries[0]]
+            for entry in entries[1:]:
+                if entry[0] == deduped[-1][0]:
+                    deduped[-1] = entry
+                else:
+                    deduped.append(entry)
+            entries = deduped
+
+        n = len(entries)
+        if n == 0:
+            return index
+
+        min_keys = index._min_keys
+        max_keys = index._max_keys
+        max_children = 2 * min_degree
+
+        # 1. Pack leaves left to right, promoting one entry between adjacent
+        # leaves as a separator. When taking a full leaf would leave the
+        # remainder underfull, split the remainder evenly instead - both
+        # halves are then guaranteed >= min_keys.
+        nodes = []
+        separators = []
+        i = 0
+        while i < n:
+            remaining = n - i
+            if remaining <= max_keys:
+                take = remaining
+            elif remaining - max_keys - 1 >= min_keys:
+                take = max_keys
             else:
-                # Internal node deletion - replace with successor
-                original_value = current.get_value(key_index)
-
-                # Find successor - leftmost key in right child
-                successor_node = current.get_child(key_index + 1)
-                while not successor_node.is_leaf:
-                    if len(successor_node.children) == 0:
-                        # Successor path is broken, try predecessor instead
-                        break
-                    successor_node = successor_node.get_child(0)
-
-                # Check if successor node has keys
-                if len(successor_node) > 0:
-                    # Replace with successor
-                    successor_key = successor_node.get_key(0)
-                    successor_value = successor_node.get_value(0)
-                    current.remove_key_value_pair(key_index)
-                    current.insert_key_value(successor_key, successor_value)
-                    # Delete successor from leaf
-                    self._delete_from_node(current.get_child(key_index + 1), successor_key)
-                    # Check for underflow in child after deletion
-                    if key_index + 1 < len(current.children):
-                        child = current.get_child(key_index + 1)
-                        if len(child) < (self._min_degree - 1):
-                            self._fix_underflow(current, key_index + 1)
+                take = (remaining - 1) // 2
+            chunk = entries[i:i + take]
+            leaf = BTreeNode(min_degree, True)
+            leaf.keys = [key for key, _ in chunk]
+            leaf.values = [value for _, value in chunk]
+            nodes.append(leaf)
+            i += take
+            if i < n:
+                separators.append(entries[i])
+                i += 1
+
+        # 2. Build parent levels until a single root remains. separators[j]
+        # sits between nodes[j] and nodes[j + 1]; a parent taking `take`
+        # children absorbs the take - 1 separators between them and the
+        # separator after the group is promoted to the next level up.
+        while len(nodes) > 1:
+            level_width = len(nodes)
+            new_nodes = []
+            new_separators = []
+            i = 0
+            while i < level_width:
+                remaining = level_width - i
+                if remaining <= max_children:
+                    take = remaining
+                elif remaining - max_children >= min_degree:
+                    take = max_children
                 else:
-                    # Try predecessor instead
-                    predecessor_node = current.get_child(key_index)
-                    while not predecessor_node.is_leaf:
-                        if len(predecessor_node.children) == 0:
-                            break
-                        predecessor_node = predecessor_node.get_child(len(predecessor_node.children) - 1)
-
-                    if len(predecessor_node) > 0:
-                        # Replace with predecessor
-                        pred_key = predecessor_node.get_key(len(predecessor_node) - 1)
-                        pred_value = predecessor_node.get_value(len(predecessor_node) - 1)
-                        current.remove_key_value_pair(key_index)
-                        current.insert_key_value(pred_key, pred_value)
-                        # Delete predecessor
-                        self._delete_from_node(current.get_child(key_index), pred_key)
-                        # Check for underflow
-                        if key_index < len(current.children):
-                            child = current.get_child(key_index)
-                            if len(child) < (self._min_degree - 1):
-                                self._fix_underflow(current, key_index)
-                    else:
-                        # Both successor and predecessor are empty, just remove the key
-                        current.remove_key_value_pair(key_index)
-                        self._size -= 1
-
-                return original_value
-        
-        elif not current.is_leaf:
-            # Key not found - descend to appropriate child
-            child_index = current.get_child_index(key)
-            result = self._delete_from_node(current.get_child(child_index), key)
-            # Check for underflow in child after deletion
-            if child_index < len(current.children) and len(current.get_child(child_index)) < (self._min_degree - 1):
-                self._fix_underflow(current, child_index)
-            
-            return result
-        
-        return None
-    
-
-    def _fix_underflow(self, parent: BTreeNode, child_index: int):
-        # Bounds checking
-        if child_index >= len(parent.children) or len(parent) == 0:
-            return
-
-        child = parent.get_child(child_index)
-        # Defensive check - child should be underflowing
-        if len(child) >= (self._min_degree - 1):
-            return
-
-        # Try to borrow from left sibling first
-        if child_index > 0:
-            left_sibling = parent.get_child(child_index - 1)
-            if len(left_sibling) > (self._min_degree - 1):
-                self._borrow_from_left_sibling(child, parent, child_index)
-                return
-
-        # Try to borrow from right sibling
-        if child_index < (len(parent.children) - 1):
-            right_sibling = parent.get_child(child_index + 1)
-            if len(right_sibling) > (self._min_degree - 1):
-                self._borrow_from_right_sibling(child, parent, child_index)
-                return
-
-        # Cannot borrow - must merge with a sibling
-        if child_index > 0 and len(parent) > child_index - 1:
-            # Merge with left sibling
-            self._merge_with_left_sibling(child, parent, child_index)
-        elif child_index < (len(parent.children) - 1) and len(parent) > child_index:
-            self._merge_with_right_sibling(child, parent, child_index)
+                    take = remaining // 2
+                parent = BTreeNode(min_degree, False)
+                parent.children = nodes[i:i + take]
+                group_separators = separators[i:i + take - 1]
+                parent.keys = [key for key, _ in group_separators]
+                parent.values = [value for _, value in group_separators]
+                new_nodes.append(parent)
+                if i + take < level_width:
+                    new_separators.append(separators[i + take - 1])
+                i += take
+            nodes = new_nodes
+            separators = new_separators
+
+        index._root = nodes[0]
+        index._size = n
+        return index
+
+    def _split_node(self, current: BTreeNode[K, V], parent: BTreeNode[K, V],
+                    parent_child_index: int) -> None:
+        # 1. Get the middle index and remember the entry being promoted
+        middle_index = self._min_keys
+        middle_key = current.keys[middle_index]
+        middle_value = current.values[middle_index]
+        # 2. Create new right node (recycled from the free pool when possible)
+        right = self._allocate_node(current.is_leaf)
+
+        # 3. Bulk-move keys/values from middle_index + 1 ... end to the right
+        # node with slice copies (one C-level memmove each) instead of a
+        # remove/reinsert loop, then truncate the middle entry away as well
+        right.keys = current.keys[middle_index + 1:]
+        right.values = current.values[middle_index + 1:]
+        del current.keys[middle_index:]
+        del current.values[middle_index:]
+
+        # 4. If not leaf (internal node), move all children from
+        # middle_index + 1 ... end to the right node the same way
+        if not current.is_leaf:
+            right.children = current.children[middle_index + 1:]
+            del current.children[middle_index + 1:]
 
+        # 5. The caller descended through parent.children[parent_child_index],
+        # so the median's slot in the parent is already known - place it and
+        # the new right child there directly instead of re-binary-searching
+        parent.keys.insert(parent_child_index, middle_key)
+        parent.values.insert(parent_child_index, middle_value)
+        parent.children.insert(parent_child_index + 1, right)
 
     def _borrow_from_left_sibling(self, node: BTreeNode[K, V], parent: BTreeNode[K, V], node_index: int):
         # 1. Get the left sibling
-        left_sibling = parent.get_child(node_index - 1)
+        left_sibling = parent.children[node_index - 1]
         separator_index = node_index - 1
-        # Remove the separator from the parent
-        separator = parent.remove_key_value_pair(separator_index)
-        # 3. Get largest key from the left sibling
-        borrowed_key = left_sibling.remove_key_value_pair(len(left_sibling) - 1)
-        # 4. Move borrowed key to the parent
-        parent.insert_key_value(borrowed_key.key, borrowed_key.value)
-        # 5. Move separator to the current node at the beginning
-        node.insert_key_value(separator.key, separator.value)
-        # 6. Handle children for internal nodes
+        # 2. Separator rotates down to the front of the current node; the
+        # largest entry of the left sibling rotates up to take its place.
+        # Overwrite the separator slot in place - no remove + re-sort needed.
+        node.keys.insert(0, parent.keys[separator_index])
+        node.values.insert(0, parent.values[separator_index])
+        parent.keys[separator_index] = left_sibling.keys.pop()
+        parent.values[separator_index] = left_sibling.values.pop()
+        # 3. Handle children for internal nodes
         if not node.is_leaf:
             # Move right most child from the left sibling to current node
-            removed_child = left_sibling.remove_child(len(left_sibling.children) - 1)
-            node.insert_child(0, removed_child)
+            node.children.insert(0, left_sibling.children.pop())
 
 
     def _borrow_from_right_sibling(self, node: BTreeNode[K, V], parent: BTreeNode[K, V], node_index: int):
         # 1. Get the right sibling
-        right_sibling = parent.get_child(node_index + 1)
-        # Remove the separator from the parent
-        separator = parent.remove_key_value_pair(node_index)
-        # 3. Get largest key from the left sibling
-        borrowed_key = right_sibling.remove_key_value_pair(0)
-        # 4. Move borrowed key to the parent
-        parent.insert_key_value(borrowed_key.key, borrowed_key.value)
-        # 5. Move separator to the current node at the beginning
-        node.insert_key_value(separator.key, separator.value)
-        # 6. Handle children for internal nodes
+        right_sibling = parent.children[node_index + 1]
+        # 2. Separator rotates down to the end of the current node; the
+        # smallest entry of the right sibling rotates up to take its place
+        node.keys.append(parent.keys[node_index])
+        node.values.append(parent.values[node_index])
+        parent.keys[node_index] = right_sibling.keys.pop(0)
+        parent.values[node_index] = right_sibling.values.pop(0)
+        # 3. Handle children for internal nodes
         if not node.is_leaf:
             # Move left most child from the right sibling to current node
-            removed_child = right_sibling.remove_child(0)
-            node.insert_child(len(node.children), removed_child)
-
-    
-    def _merge_with_left_sibling(self, node: BTreeNode[K, V], parent: BTreeNode[K, V], node_index: int):
-        # Bounds check
-        if node_index <= 0 or node_index - 1 >= len(parent):
-            return
-
-        left_sibling = parent.get_child(node_index - 1)
-        # Attempt fallback to borrowing if merge is unsafe
-        if self._cannot_safely_merge(left_sibling, node) and len(left_sibling) > (self._min_degree - 1):
-            self._borrow_from_left_sibling(node, parent, node_index)
-            return
-
-        # Safe to merge - check if separator exists
-        if node_index - 1 < len(parent):
-            separator = parent.remove_key_value_pair(node_index - 1)
-            left_sibling.insert_key_value(separator.key, separator.value)
-
-        # Move all nodes from current node to left sibling
-        while len(node) > 0:
-            removed_key = node.remove_key_value_pair(0)
-            left_sibling.insert_key_value(removed_key.key, removed_key.value)
-
-        # Move all children from current node to left sibling
-        if not node.is_leaf:
-            while len(node.children) > 0:
-                left_sibling.insert_child(len(left_sibling.children), node.remove_child(0))
-
-        # Remove current node from parent
-        if node_index < len(parent.children):
-            parent.remove_child(node_index)
-
-    
-    def _merge_with_right_sibling(self, node: BTreeNode[K, V], parent: BTreeNode[K, V], node_index: int):
-        # Bounds check
-        if node_index >= len(parent.children) - 1 or node_index >= len(parent):
-            return
-
-        right_sibling = parent.get_child(node_index + 1)
-        # Attempt fallback to borrowing if merge is unsafe
-        if self._cannot_safely_merge(node, right_sibling) and len(right_sibling) > (self._min_degree - 1):
-            self._borrow_from_right_sibling(node, parent, node_index)
-            return
-
-        # Safe to merge - check if separator exists
-        if node_index < len(parent):
-            separator = parent.remove_key_value_pair(node_index)
-            node.insert_key_value(separator.key, separator.value)
-
-        # Move all keys from right sibling to current node
-        while len(right_sibling) > 0:
-            removed_key = right_sibling.remove_key_value_pair(0)
-            node.insert_key_value(removed_key.key, removed_key.value)
-
-        # Move all children from right sibling to current node
+            node.children.append(right_sibling.children.pop(0))
+
+
+    def _merge_children(self, parent: BTreeNode[K, V], separator_index: int):
+        """Merge children[separator_index + 1] into children[separator_index]
+        around the separator key. Both children hold min_degree - 1 keys when
+        this is called, so the merged node holds exactly 2 * min_degree - 1.
+        """
+        node = parent.children[separator_index]
+        right_sibling = parent.children[separator_index + 1]
+
+        # 1. Pull the separator down into the left node. Everything in the
+        # left node is smaller and everything in the right sibling larger, so
+        # append + extend keeps the key list sorted without any re-searching.
+        node.keys.append(parent.keys.pop(separator_index))
+        node.values.append(parent.values.pop(separator_index))
+
+        # 2. Bulk-move the right sibling's entries with one C-level extend
+        node.keys.extend(right_sibling.keys)
+        node.values.extend(right_sibling.values)
+
+        # 3. Same for the children of internal nodes
         if not node.is_leaf:
-            while len(right_sibling.children) > 0:
-                node.insert_child(len(node.children), right_sibling.remove_child(0))
-
-        # Remove right sibling from parent
-        if node_index + 1 < len(parent.children):
-            parent.remove_child(node_index + 1)
-
-    
-    def _cannot_safely_merge(self, node1: BTreeNode[K, V], node2: BTreeNode[K, V]) -> bool:
-        total_keys = len(node1) + 1 + len(node2)
-        return total_keys > (2 * self._min_degree - 1)
-    
+            node.children.extend(right_sibling.children)
+
+        # 4. Remove the right sibling from the parent and recycle it
+        del parent.children[separator_index + 1]
+        self._release_node(right_sibling)
+
+    def _allocate_node(self, is_leaf: bool) -> BTreeNode[K, V]:
+        """Reuse a node recycled by a merge, or build a fresh one."""
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            node._is_leaf = is_leaf
+            return node
+        return BTreeNode(self._min_degree, is_leaf)
+
+    def _release_node(self, node: BTreeNode[K, V]) -> None:
+        """Return a node emptied by a merge to the free pool.
+
+        The pool is per-tree rather than module-level: every pooled node
+        then has the right min_degree by construction (no compatibility
+        check on reuse), and dropping the tree drops its pool instead of
+        pinning nodes for unrelated trees.
+        """
+        if len(self._free_nodes) < self._FREE_NODE_LIMIT:
+            node.keys.clear()
+            node.values.clear()
+            node.children.clear()
+            self._free_nodes.append(node)
+
+
     @property
     def min_degree(self) -> int:
         return self._min_degree
@@ -367,11 +535,12 @@ class BTreeIndex(Generic[K, V]):
     def is_empty(self) -> bool:
         return self._size == 0
 
-    def __setattr__(self, name, value):
-        if name == "_min_degree":
-            raise AttributeError("min_degree is immutable and cannot be modified")
-        return super().__setattr__(name, value)
-
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"BTreeIndex(min_degree={self._min_degree}, size={self._size})"
+
+
+# Freeze _min_degree: keep the original member descriptor for __init__'s one
+# legitimate write, then shadow the slot with a read-only view
+_MIN_DEGREE_MEMBER = BTreeIndex._min_degree
+BTreeIndex._min_degree = _FrozenSlot(_MIN_DEGREE_MEMBER)
@@ -1,114 +1,149 @@
-from typing import Generic, TypeVar, List
-import bisect
+from typing import Generic, TypeVar, List, Tuple
+from bisect import bisect_left, bisect_right
 from .key_value_pair import KeyValuePair
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+
+class _FrozenSlot:
+    """Read-only data descriptor wrapping a __slots__ member descriptor.
+
+    Installing this over a slot rejects writes at descriptor-lookup time,
+    so the class needs no __setattr__ override - every other attribute
+    write (and nodes mutate keys/values/children/_is_leaf constantly
+    during splits and merges) goes through CPython's C-level slot
+    assignment instead of a Python method call.
+    """
+    __slots__ = ("_member",)
+
+    def __init__(self, member):
+        self._member = member
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self._member.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        raise AttributeError("min_degree is immutable and cannot be modified")
+
+
 class BTreeNode(Generic[K, V]):
     """
-    Saves memory (important when million of entries)
+    Struct-of-arrays node layout: parallel keys/values/children lists
+    instead of one KeyValuePair object per slot. Saves memory (important
+    when million of entries) and lets bisect scan a contiguous key list in C.
     """
-    __slots__ = ("_min_degree", "_is_leaf", "_key_value_pairs", "_children")
+    __slots__ = ("_min_degree", "_max_keys", "_min_keys", "_is_leaf",
+                 "keys", "values", "children")
 
     def __init__(self, min_degree: int, is_leaf: bool = True):
         if min_degree < 2:
             raise ValueError("Minimum degress must be at least 2")
-        # Make _min_degree immutable
-        super().__setattr__("_min_degree", min_degree)
+        # _min_degree is frozen by the _FrozenSlot installed below the class
+        # body; write through the retained member descriptor to initialize it
+        _MIN_DEGREE_MEMBER.__set__(self, min_degree)
+        # Capacity bounds derived once; is_full/is_underflow run on every
+        # descent, so they should not redo the arithmetic per call
+        self._max_keys = 2 * min_degree - 1
+        self._min_keys = min_degree - 1
         self._is_leaf = is_leaf # Mutable - can change during splits
-        self._key_value_pairs: List[KeyValuePair[K, V]] = []
-        self._children: List['BTreeNode[K, V]'] = []
+        self.keys: List[K] = []
+        self.values: List[V] = []
+        self.children: List['BTreeNode[K, V]'] = []
+
+    def __class_getitem__(cls, item):
+        # The generic parameters serve static checkers only; skip typing's
+        # _GenericAlias construction (and its per-use allocation) so
+        # BTreeNode[int, str] is just the class itself at runtime
+        return cls
 
     @property
     def min_degree(self) -> int:
         return self._min_degree
-    
+
     @property
     def is_leaf(self) -> bool:
         return self._is_leaf
-    
+
     @is_leaf.setter
     def is_leaf(self, value: bool):
         self._is_leaf = value
 
     def __len__(self) -> int:
-        return len(self._key_value_pairs)
-    
+        return len(self.keys)
+
     # Get key at index
     def get_key(self, index: int) -> K:
-        return self._key_value_pairs[index].key
-    
+        return self.keys[index]
+
     # Get value at index
     def get_value(self, index: int) -> V:
-        return self._key_value_pairs[index].value
-    
+        return self.values[index]
+
     # Get key value pair at index
     def get_key_value_pair(self, index: int) -> KeyValuePair[K, V]:
-        return self._key_value_pairs[index]
-    
+        return KeyValuePair(self.keys[index], self.values[index])
+
     # Get child at index
     def get_child(self, index: int) -> 'BTreeNode[K, V]':
-        return self._children[index]
-    
-    @property
-    def children(self) -> List['BTreeNode[K, V]']:
-        return self._children
-    
+        return self.children[index]
+
     # Core operations
     def is_full(self) -> bool:
-        return len(self._key_value_pairs) >= (2 * self._min_degree - 1)
-    
+        return len(self.keys) >= self._max_keys
+
     def is_underflow(self) -> bool:
-        return len(self._key_value_pairs) < (self.min_degree - 1)
-    
+        return len(self.keys) < self._min_keys
+
     def insert_key_value(self, key: K, value: V):
         """
-        Python-optimized version using bisect for O(log n) insertion point finding.
+        Insert directly into the parallel key/value lists: one bisect on the
+        contiguous key list (O(log n) compares in C) and two list.inserts.
+        No per-entry wrapper object is allocated on this path.
         """
-        new_pair = KeyValuePair(key, value)
-        # Extract keys for bisect
-        keys = [pair.key for pair in self._key_value_pairs]
-        insert_position = bisect.bisect_left(keys, key)
+        insert_position = bisect_left(self.keys, key)
+        self.keys.insert(insert_position, key)
+        self.values.insert(insert_position, value)
 
-        self._key_value_pairs.insert(insert_position, new_pair)
+    def locate(self, key: K) -> Tuple[int, bool]:
+        """Single binary search serving both lookup and descent.
+
+        Returns (index, found): when found, index points at the key;
+        otherwise it is the insertion point, which is also the child
+        index to descend into.
+        """
+        keys = self.keys
+        index = bisect_left(keys, key)
+        return index, index < len(keys) and keys[index] == key
 
     def find_key_index(self, key: K) -> int:
-        if not self._key_value_pairs:
-            return -1
-        
-        keys = [pair.key for pair in self._key_value_pairs]
-        position = bisect.bisect_left(keys, key)
-        
-        # Check if we found exact match
-        if position < len(keys) and keys[position] == key:
-            return position
-        else:
-            return -(position + 1)
+        index, found = self.locate(key)
+        return index if found else -(index + 1)
 
     def get_child_index(self, key: K) -> int:
-        key_index = self.find_key_index(key)
-        if key_index >= 0:
-            return key_index + 1
-        else:
-            return -(key_index + 1)
-        
+        # Node keys are unique, so "equal keys descend right" is exactly
+        # bisect_right: one C call, no equality check or branch needed
+        return bisect_right(self.keys, key)
+
     # Mutation operations
     def insert_child(self, index: int, child: 'BTreeNode[K, V]') -> None:
-        self._children.insert(index, child)
+        self.children.insert(index, child)
 
     def remove_key_value_pair(self, index: int) -> KeyValuePair[K, V]:
-        return self._key_value_pairs.pop(index)
-    
+        key = self.keys.pop(index)
+        return KeyValuePair(key, self.values.pop(index))
+
     def remove_child(self, index: int) -> 'BTreeNode[K, V]':
-        return self._children.pop(index)
-    
-    def __setattr__(self, name, value):
-        if name == "_min_degree":
-            raise AttributeError("min_degree is immutable and cannot be modified")
-        return super().__setattr__(name, value)
-    
+        return self.children.pop(index)
+
     def __repr__(self):
-        keys = [pair.key for pair in self._key_value_pairs]
         node_type = " (leaf)" if self._is_leaf else ""
-        return f"Node{keys}{node_type}"
\ No newline at end of file
+        return f"Node{self.keys}{node_type}"
+
+
+# Freeze _min_degree: keep the original member descriptor for __init__'s one
+# legitimate write, then shadow the slot with a read-only view
+_MIN_DEGREE_MEMBER = BTreeNode._min_degree
+BTreeNode._min_degree = _FrozenSlot(_MIN_DEGREE_MEMBER)
@@ -6,8 +6,12 @@ V = TypeVar("V")
 class KeyValuePair(Generic[K, V]):
     """
     Saves memory (important when million of entries)
+
+    Boundary object only: nodes store keys and values in parallel lists,
+    so no KeyValuePair is allocated on the insert/search/delete paths.
+    Instances are built on demand when a caller asks for a pair.
     """
-    __slots__ = ("_key", "value")
+    __slots__ = ("_key", "value", "_hash")
 
     def __init__(self, key: K, value: V):
         if key is None:
@@ -18,19 +22,40 @@ class KeyValuePair(Generic[K, V]):
     @property
     def key(self) -> K:
         return self._key
-    
+
     def __setattr__(self, name, value):
         if name == "_key":
             raise AttributeError("Key is immutable and cannot be modified")
-        return super().__setattr__(name, value)
-    
+        super().__setattr__(name, value)
+        if name == "value":
+            # Hash depends on the value; recompute lazily on next use
+            super().__setattr__("_hash", None)
+
     def __eq__(self, other):
-        if not isinstance(other, KeyValuePair):
+        # Exact-type check: the class is not designed for subclassing, so a
+        # single pointer compare replaces the isinstance call. NotImplemented
+        # lets Python fall back to its default (unequal) handling for other
+        # types, as before.
+        if other.__class__ is not KeyValuePair:
+            return NotImplemented
+        # When both sides carry a cached hash, differing hashes prove
+        # inequality without touching the values - worthwhile when values
+        # are large (long strings) and buckets collide in a set/dict
+        if (self._hash is not None and other._hash is not None
+                and self._hash != other._hash):
             return False
-        return self._key == other.key and self.value == other.value
-    
+        # Read the slot directly - going through the key property would pay
+        # a descriptor call per compare, which adds up in set/dict lookups
+        return self._key == other._key and self.value == other.value
+
     def __hash__(self):
-        return hash((self._key, self.value))
-    
+        # Computed once per value, so hashing the same pair repeatedly
+        # (set/dict membership in loops) skips the tuple allocation
+        cached = self._hash
+        if cached is None:
+            cached = hash((self._key, self.value))
+            super().__setattr__("_hash", cached)
+        return cached
+
     def __repr__(self):
         return f"({self.key} -> {self.value})"
\ No newline at end of file
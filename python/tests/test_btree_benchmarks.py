@@ -0,0 +1,94 @@
+"""pytest-benchmark micro-benchmarks for the B-Tree.
+
+The hand-rolled timing tests in test_btree_performance.py are pass/fail
+gates; they cannot track regressions across commits. These benchmarks
+delegate warmup, repetition, and statistics to pytest-benchmark so a
+proposed optimization can be compared before/after::
+
+    pytest tests/test_btree_benchmarks.py -m slow --override-ini=addopts= \
+        --benchmark-autosave            # save a baseline
+    ... make a change ...
+    pytest tests/test_btree_benchmarks.py -m slow --override-ini=addopts= \
+        --benchmark-compare             # compare against the baseline
+
+Marked slow (and skipped entirely when pytest-benchmark is not
+installed) so regular runs stay fast.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from database_mechanics.indexing.btree.btree_index import BTreeIndex
+from database_mechanics.indexing.btree.key_value_pair import KeyValuePair
+
+pytestmark = pytest.mark.slow
+
+N = 1000
+
+
+def build_tree(keys):
+    """Build a fresh tree from the given keys."""
+    btree = BTreeIndex[int, str](min_degree=16)
+    for key in keys:
+        btree.insert(key, f"value_{key}")
+    return btree
+
+
+@pytest.mark.benchmark(group="insert")
+def test_sequential_insert_benchmark(benchmark):
+    """Benchmark ascending inserts into a fresh tree."""
+    benchmark(build_tree, range(N))
+
+
+@pytest.mark.benchmark(group="insert")
+def test_random_insert_benchmark(benchmark):
+    """Benchmark shuffled inserts into a fresh tree."""
+    keys = list(range(N))
+    random.seed(42)
+    random.shuffle(keys)
+    benchmark(build_tree, keys)
+
+
+@pytest.mark.benchmark(group="insert")
+def test_bulk_load_benchmark(benchmark):
+    """Benchmark the O(n) bottom-up build for comparison with inserts."""
+    items = [(key, f"value_{key}") for key in range(N)]
+    benchmark(BTreeIndex.bulk_load, items, 16)
+
+
+@pytest.mark.benchmark(group="search")
+def test_search_benchmark(benchmark):
+    """Benchmark random point lookups on a prebuilt tree."""
+    btree = build_tree(range(N))
+    random.seed(42)
+    probes = [random.randrange(N) for _ in range(N)]
+    benchmark(lambda: [btree.search(key) for key in probes])
+
+
+@pytest.mark.benchmark(group="pair")
+def test_pair_set_construction_benchmark(benchmark):
+    """Benchmark building a set of pairs (construction + hash per element)."""
+    benchmark(lambda: {KeyValuePair(i, i) for i in range(10_000)})
+
+
+@pytest.mark.benchmark(group="pair")
+def test_pair_dict_lookup_benchmark(benchmark):
+    """Benchmark pairs as dict keys (cached hash + __eq__ on hits)."""
+    mapping = {KeyValuePair(i, f"value_{i}"): i for i in range(10_000)}
+    probes = [KeyValuePair(i, f"value_{i}") for i in range(10_000)]
+    benchmark(lambda: [mapping[probe] for probe in probes])
+
+
+@pytest.mark.benchmark(group="delete")
+def test_delete_benchmark(benchmark):
+    """Benchmark deleting half the keys; each round gets a fresh tree."""
+    random.seed(42)
+    keys = random.sample(range(N), N // 2)
+    benchmark.pedantic(
+        lambda btree: [btree.delete(key) for key in keys],
+        setup=lambda: ((build_tree(range(N)),), {}),
+        rounds=10,
+    )
@@ -442,6 +442,147 @@ class TestBTreeEdgeCases:
         assert "grape" not in btree
 
 
+class TestBTreeInsertMany:
+    """Test batch insertion with leaf-path caching."""
+
+    def test_insert_many_sorted_run(self):
+        """Test batch insertion of an already sorted run."""
+        btree = BTreeIndex[int, str](min_degree=3)
+        btree.insert_many((key, f"value_{key}") for key in range(100))
+
+        assert len(btree) == 100
+        for key in range(100):
+            assert btree.search(key) == f"value_{key}"
+
+    def test_insert_many_random_order(self):
+        """Test batch insertion when keys keep leaving the cached leaf."""
+        keys = list(range(200))
+        random.shuffle(keys)
+        btree = BTreeIndex[int, int](min_degree=4)
+        btree.insert_many((key, key * 2) for key in keys)
+
+        assert len(btree) == 200
+        for key in keys:
+            assert btree.search(key) == key * 2
+
+    def test_insert_many_updates_existing_keys(self):
+        """Test that duplicate keys update values without growing the tree."""
+        btree = BTreeIndex[int, str](min_degree=3)
+        btree.insert_many((key, f"initial_{key}") for key in range(30))
+        btree.insert_many((key, f"updated_{key}") for key in range(30))
+
+        assert len(btree) == 30
+        for key in range(30):
+            assert btree.search(key) == f"updated_{key}"
+
+
+class TestBTreeSearchMany:
+    """Test batch lookup with a shared sorted-probe traversal."""
+
+    def test_search_many_preserves_input_order(self):
+        """Test that results line up with the (unsorted) probe order."""
+        btree = BTreeIndex[int, str](min_degree=3)
+        for key in range(50):
+            btree.insert(key, f"value_{key}")
+
+        probes = [37, 2, 49, 0, 25]
+        assert btree.search_many(probes) == [f"value_{key}" for key in probes]
+
+    def test_search_many_missing_keys(self):
+        """Test that absent keys come back as None alongside hits."""
+        btree = BTreeIndex[int, int](min_degree=3)
+        for key in range(0, 100, 2):
+            btree.insert(key, key * 10)
+
+        assert btree.search_many([4, 5, 98, 99, -1]) == [40, None, 980, None, None]
+        assert btree.search_many([]) == []
+        assert BTreeIndex[int, int](min_degree=3).search_many([1, 2]) == [None, None]
+
+    def test_search_many_matches_individual_searches(self):
+        """Test batch lookup against search() on a randomized tree."""
+        keys = list(range(300))
+        random.shuffle(keys)
+        btree = BTreeIndex[int, int](min_degree=4)
+        for key in keys:
+            btree.insert(key, key * 3)
+
+        probes = [random.randrange(-10, 310) for _ in range(150)]
+        probes += [probes[0]]  # duplicate probes must each get an answer
+        assert btree.search_many(probes) == [btree.search(key) for key in probes]
+
+
+class TestBTreeBulkLoad:
+    """Test bottom-up bulk loading of sorted data."""
+
+    def test_bulk_load_basic(self):
+        """Test bulk loading from unsorted input."""
+        items = [(key, f"value_{key}") for key in [30, 10, 50, 20, 40]]
+        btree = BTreeIndex.bulk_load(items, min_degree=3)
+
+        assert len(btree) == 5
+        for key in [10, 20, 30, 40, 50]:
+            assert btree.search(key) == f"value_{key}"
+
+    def test_bulk_load_empty(self):
+        """Test bulk loading with no items."""
+        btree = BTreeIndex.bulk_load([], min_degree=3)
+
+        assert len(btree) == 0
+        assert btree.is_empty()
+        assert btree.search(1) is None
+
+        # Tree should be usable after an empty bulk load
+        btree.insert(1, "one")
+        assert btree.search(1) == "one"
+
+    def test_bulk_load_duplicate_keys(self):
+        """Test that the last occurrence of a duplicate key wins."""
+        items = [(1, "first"), (2, "two"), (1, "second"), (1, "third")]
+        btree = BTreeIndex.bulk_load(items, min_degree=3)
+
+        assert len(btree) == 2
+        assert btree.search(1) == "third"
+        assert btree.search(2) == "two"
+
+    def test_bulk_load_matches_incremental_inserts(self):
+        """Test that a bulk-loaded tree answers like an insert-built one."""
+        keys = list(range(500))
+        random.shuffle(keys)
+        items = [(key, key * 2) for key in keys]
+
+        bulk = BTreeIndex.bulk_load(items, min_degree=4)
+        incremental = BTreeIndex[int, int](min_degree=4)
+        for key, value in items:
+            incremental.insert(key, value)
+
+        assert len(bulk) == len(incremental)
+        for key in keys:
+            assert bulk.search(key) == incremental.search(key) == key * 2
+
+    def test_bulk_load_various_sizes_and_degrees(self):
+        """Test boundary sizes around node capacity for several degrees."""
+        for min_degree in [2, 3, 5]:
+            max_keys = 2 * min_degree - 1
+            for n in [1, max_keys - 1, max_keys, max_keys + 1,
+                      max_keys * 3, 100]:
+                items = [(key, f"value_{key}") for key in range(n)]
+                btree = BTreeIndex.bulk_load(items, min_degree=min_degree)
+
+                assert len(btree) == n
+                for key in range(n):
+                    assert btree.search(key) == f"value_{key}"
+
+    def test_bulk_loaded_tree_supports_mutation(self):
+        """Test that insert/delete keep working on a bulk-loaded tree."""
+        items = [(key, f"value_{key}") for key in range(200)]
+        btree = BTreeIndex.bulk_load(items, min_degree=3)
+
+        # Delete every key to exercise rebalancing across the packed tree
+        for key in range(200):
+            assert btree.delete(key) == f"value_{key}"
+        assert btree.is_empty()
+
+
 @pytest.fixture
 def sample_btree():
     """Fixture providing a sample B-Tree for testing."""
@@ -91,6 +91,12 @@ class TestBTreePerformance:
         btree = BTreeIndex[int, str](min_degree=20)
         n = 5000
 
+        # Pre-generate all random keys so the timed section measures tree
+        # operations, not the random module
+        search_keys = [random.randint(0, n - 1) for _ in range(n // 2)]
+        update_keys = [random.randint(0, n - 1) for _ in range(n // 2)]
+        delete_keys = random.sample(range(n + n // 2), n // 4)
+
         def mixed_operations():
             # Phase 1: Insert many elements
             for i in range(n):
@@ -99,10 +105,10 @@ class TestBTreePerformance:
             # Phase 2: Mixed operations
             for i in range(n // 2):
                 # Search
-                btree.search(random.randint(0, n - 1))
+                btree.search(search_keys[i])
 
                 # Update
-                key = random.randint(0, n - 1)
+                key = update_keys[i]
                 btree.insert(key, f"updated_{key}_{i}")
 
                 # Insert new
@@ -110,7 +116,6 @@ class TestBTreePerformance:
                 btree.insert(new_key, f"new_{new_key}")
 
             # Phase 3: Delete some elements
-            delete_keys = random.sample(range(n + n // 2), n // 4)
             for key in delete_keys:
                 btree.delete(key)
 
@@ -150,6 +155,9 @@ class TestBTreeScalability:
         """Test how performance scales with tree size."""
         sizes = [1000, 5000, 10000, 25000]
         min_degree = 50
+        # Seeded local generator: identical probe sets across runs make the
+        # scaling ratios comparable from one run to the next
+        rng = random.Random(0)
 
         insertion_times = []
         search_times = []
@@ -165,7 +173,7 @@ class TestBTreeScalability:
             insertion_times.append(insertion_time)
 
             # Test search scaling
-            search_keys = random.sample(range(size), min(100, size))
+            search_keys = rng.sample(range(size), min(100, size))
             start_time = time.perf_counter()
             for key in search_keys:
                 btree.search(key)
@@ -183,6 +191,10 @@ class TestBTreeScalability:
         """Test performance with different min_degree values."""
         degrees = [3, 10, 50, 100]
         n = 10000
+        # Same fixed probe set for every degree, so the comparison across
+        # degrees (and across runs) is apples to apples
+        rng = random.Random(0)
+        search_keys = rng.sample(range(n), 100)
 
         for degree in degrees:
             btree = BTreeIndex[int, str](min_degree=degree)
@@ -194,7 +206,6 @@ class TestBTreeScalability:
             insertion_time = time.perf_counter() - start_time
 
             # Test search time
-            search_keys = random.sample(range(n), 100)
             start_time = time.perf_counter()
             for key in search_keys:
                 btree.search(key)
@@ -298,12 +309,16 @@ class TestBTreeConcurrencyReadiness:
         btree = BTreeIndex[int, str](min_degree=50)
         n_operations = 10000
 
+        # Pre-generate the keys; random.randint inside the timed loop would
+        # be measured as part of the tree's throughput
+        keys = [random.randint(0, n_operations) for _ in range(n_operations)]
+
         # Rapid-fire mixed operations
         start_time = time.perf_counter()
 
         for i in range(n_operations):
             operation = i % 4
-            key = random.randint(0, n_operations)
+            key = keys[i]
 
             if operation == 0:  # Insert
                 btree.insert(key, f"value_{key}_{i}")